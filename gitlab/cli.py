@@ -23,7 +23,7 @@ import os
 import re
 import sys
 from types import ModuleType
-from typing import Any, Callable, cast, Dict, Optional, Tuple, Type, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
 from requests.structures import CaseInsensitiveDict
 
@@ -42,6 +42,18 @@ camel_lowerupper_regex = re.compile(r"([a-z\d])([A-Z])")
 # }
 custom_actions: Dict[str, Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], bool]]] = {}
 
+# Actions declared by register_custom_action() and not yet added to
+# custom_actions: (cls_names, mandatory, optional, custom_action, method name)
+_pending_actions: List[
+    Tuple[
+        Union[str, Tuple[str, ...]],
+        Tuple[str, ...],
+        Tuple[str, ...],
+        Optional[str],
+        str,
+    ]
+] = []
+
 
 # For an explanation of how these type-hints work see:
 # https://mypy.readthedocs.io/en/stable/generics.html#declaring-decorators
@@ -55,12 +67,44 @@ def register_custom_action(
     mandatory: Tuple[str, ...] = (),
     optional: Tuple[str, ...] = (),
     custom_action: Optional[str] = None,
+) -> Callable[[__F], __F]:
+    # Lists are accepted too, but the cached decorators need hashable arguments
+    if not isinstance(cls_names, str):
+        cls_names = tuple(cls_names)
+    return _get_custom_action_decorator(
+        cls_names, tuple(mandatory), tuple(optional), custom_action
+    )
+
+
+# The same decorator is requested for many methods (e.g. ("Project",) with no
+# arguments), build it only once for each set of arguments.
+@functools.lru_cache(maxsize=None)
+def _get_custom_action_decorator(
+    cls_names: Union[str, Tuple[str, ...]],
+    mandatory: Tuple[str, ...],
+    optional: Tuple[str, ...],
+    custom_action: Optional[str],
 ) -> Callable[[__F], __F]:
     def wrap(f: __F) -> __F:
-        @functools.wraps(f)
-        def wrapped_f(*args: Any, **kwargs: Any) -> Any:
-            return f(*args, **kwargs)
+        # Only record the action, custom_actions is filled when the CLI needs
+        # it (see _register_pending_actions()) so that library users don't pay
+        # for it at import time.
+        _pending_actions.append(
+            (cls_names, mandatory, optional, custom_action, f.__name__)
+        )
+
+        # Registration is all we need, return the method itself rather than a
+        # wrapper that would add a function call to every invocation.
+        return f
 
+    return wrap
+
+
+def _register_pending_actions() -> None:
+    """Add the actions declared by register_custom_action() to custom_actions."""
+    pending = _pending_actions[:]
+    del _pending_actions[: len(pending)]
+    for cls_names, mandatory, optional, custom_action, name in pending:
         # in_obj defines whether the method belongs to the obj or the manager
         in_obj = True
         if isinstance(cls_names, tuple):
@@ -76,13 +120,9 @@ def register_custom_action(
             if final_name not in custom_actions:
                 custom_actions[final_name] = {}
 
-            action = custom_action or f.__name__.replace("_", "-")
+            action = custom_action or name.replace("_", "-")
             custom_actions[final_name][action] = (mandatory, optional, in_obj)
 
-        return cast(__F, wrapped_f)
-
-    return wrap
-
 
 def die(msg: str, e: Optional[Exception] = None) -> None:
     if e:
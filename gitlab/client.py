@@ -16,12 +16,19 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Wrapper for the GitLab API."""
 
+import collections
 import os
+import queue
+import threading
 import time
+import weakref
+from dataclasses import dataclass
 from typing import Any, cast, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
 import requests
+import requests.adapters
 import requests.utils
+from requests.structures import CaseInsensitiveDict
 from requests_toolbelt.multipart.encoder import MultipartEncoder  # type: ignore
 
 import gitlab.config
@@ -29,6 +36,17 @@ import gitlab.const
 import gitlab.exceptions
 from gitlab import utils
 
+if TYPE_CHECKING:
+    # asyncio is imported where it is used, it is slow to import and only
+    # needed by the asynchronous methods
+    import asyncio
+
+    import httpx
+
+    # Asynchronous client of an event loop and the semaphore limiting its
+    # requests in flight
+    _AsyncClientEntry = Tuple[httpx.AsyncClient, asyncio.Semaphore]
+
 REDIRECT_MSG = (
     "python-gitlab detected a {status_code} ({reason!r}) redirection. You must update "
     "your GitLab URL to the correct URL to avoid issues. The redirection was from: "
@@ -36,6 +54,37 @@ REDIRECT_MSG = (
 )
 
 
+@dataclass(frozen=True)
+class _ETagCacheEntry:
+    etag: str
+    content: bytes
+    headers: Dict[str, str]
+    encoding: Optional[str]
+
+    @classmethod
+    def from_response(cls, result: requests.Response) -> "_ETagCacheEntry":
+        return cls(
+            etag=result.headers["ETag"],
+            content=result.content,
+            headers=dict(result.headers),
+            encoding=result.encoding,
+        )
+
+    def to_response(self, not_modified: requests.Response) -> requests.Response:
+        """Build the response to return for a 304 Not Modified answer."""
+        result = requests.Response()
+        result.status_code = 200
+        result.reason = "OK"
+        result.headers = CaseInsensitiveDict(self.headers)
+        result._content = self.content
+        # There is no raw stream to read from, iter_content() must use _content
+        result._content_consumed = True  # type: ignore
+        result.encoding = self.encoding
+        result.url = not_modified.url
+        result.request = not_modified.request
+        return result
+
+
 class Gitlab:
     """Represents a GitLab server connection.
 
@@ -56,6 +105,11 @@ class Gitlab:
         user_agent: A custom user agent to use for making HTTP requests.
         retry_transient_errors: Whether to retry after 500, 502, 503, or
             504 responses. Defaults to False.
+        pool_size: Number of connections kept open to the GitLab server, for
+            the session created when ``session`` is not given and for the
+            asynchronous client. Raise it when making requests from more
+            threads, as requests otherwise opens a new connection for each
+            request above the limit. Defaults to 32.
     """
 
     def __init__(
@@ -75,6 +129,7 @@ class Gitlab:
         order_by: Optional[str] = None,
         user_agent: str = gitlab.const.USER_AGENT,
         retry_transient_errors: bool = False,
+        pool_size: int = gitlab.const.DEFAULT_POOL_SIZE,
     ) -> None:
 
         self._api_version = str(api_version)
@@ -98,8 +153,24 @@ class Gitlab:
         self.job_token = job_token
         self._set_auth_info()
 
+        self.pool_size = pool_size
+
         #: Create a session object for requests
-        self.session = session or requests.Session()
+        if session is None:
+            session = requests.Session()
+            # Retries are handled by http_request(), not by urllib3
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+
+        self._init_etag_cache()
+
+        # The asynchronous clients are created on first use, see
+        # _get_async_client()
+        self._init_async_clients()
 
         self.per_page = per_page
         self.pagination = pagination
@@ -190,13 +261,26 @@ class Gitlab:
     def __exit__(self, *args: Any) -> None:
         self.session.close()
 
+    async def __aenter__(self) -> "Gitlab":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
     def __getstate__(self) -> Dict[str, Any]:
         state = self.__dict__.copy()
         state.pop("_objects")
+        state.pop("_async_clients")
+        state.pop("_async_clients_lock")
+        state.pop("_etag_cache")
+        state.pop("_etag_cache_lock")
+        state.pop("_etag_cache_bytes")
         return state
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
         self.__dict__.update(state)
+        self._init_async_clients()
+        self._init_etag_cache()
         # We only support v4 API at this time
         if self._api_version not in ("4",):
             raise ModuleNotFoundError(name=f"gitlab.v{self._api_version}.objects")
@@ -604,6 +688,109 @@ class Gitlab:
 
         return (post_data, None, "application/json")
 
+    def _init_etag_cache(self) -> None:
+        self._etag_cache: "collections.OrderedDict[Tuple[str, str], _ETagCacheEntry]"
+        self._etag_cache = collections.OrderedDict()
+        self._etag_cache_bytes = 0
+        self._etag_cache_lock = threading.Lock()
+
+    def _get_etag_cached(self, key: Tuple[str, str]) -> Optional[_ETagCacheEntry]:
+        with self._etag_cache_lock:
+            entry = self._etag_cache.get(key)
+            if entry is not None:
+                self._etag_cache.move_to_end(key)
+            return entry
+
+    def _set_etag_cached(self, key: Tuple[str, str], result: requests.Response) -> None:
+        if len(result.content) > gitlab.const.ETAG_CACHE_MAX_ENTRY_BYTES:
+            return
+        entry = _ETagCacheEntry.from_response(result)
+        with self._etag_cache_lock:
+            previous = self._etag_cache.pop(key, None)
+            if previous is not None:
+                self._etag_cache_bytes -= len(previous.content)
+            self._etag_cache[key] = entry
+            self._etag_cache_bytes += len(entry.content)
+            while (
+                len(self._etag_cache) > gitlab.const.ETAG_CACHE_SIZE
+                or self._etag_cache_bytes > gitlab.const.ETAG_CACHE_MAX_BYTES
+            ):
+                _, evicted = self._etag_cache.popitem(last=False)
+                self._etag_cache_bytes -= len(evicted.content)
+
+    def _get_query_params(
+        self, query_data: Optional[Dict[str, Any]], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        utils.copy_dict(src=query_data or {}, dest=params)
+
+        # Deal with kwargs: by default a user uses kwargs to send data to the
+        # gitlab server, but this generates problems (python keyword conflicts
+        # and python-gitlab/gitlab conflicts).
+        # So we provide a `query_parameters` key: if it's there we use its dict
+        # value as arguments for the gitlab server, and ignore the other
+        # arguments, except pagination ones (per_page and page)
+        if "query_parameters" in kwargs:
+            utils.copy_dict(src=kwargs["query_parameters"], dest=params)
+            for arg in ("per_page", "page"):
+                if arg in kwargs:
+                    params[arg] = kwargs[arg]
+        else:
+            utils.copy_dict(src=kwargs, dest=params)
+        return params
+
+    def _should_retry(
+        self,
+        result: Any,
+        obey_rate_limit: bool,
+        max_retries: int,
+        cur_retries: int,
+        kwargs: Dict[str, Any],
+    ) -> bool:
+        retry_transient_errors = kwargs.get(
+            "retry_transient_errors", self.retry_transient_errors
+        )
+        if (429 == result.status_code and obey_rate_limit) or (
+            result.status_code in [500, 502, 503, 504] and retry_transient_errors
+        ):
+            return max_retries == -1 or cur_retries < max_retries
+        return False
+
+    @staticmethod
+    def _get_retry_wait_time(result: Any, cur_retries: int) -> float:
+        # Response headers documentation:
+        # https://docs.gitlab.com/ee/user/admin_area/settings/user_and_ip_rate_limits.html#response-headers
+        wait_time = 2**cur_retries * 0.1
+        if "Retry-After" in result.headers:
+            wait_time = int(result.headers["Retry-After"])
+        elif "RateLimit-Reset" in result.headers:
+            wait_time = int(result.headers["RateLimit-Reset"]) - time.time()
+        return wait_time
+
+    @staticmethod
+    def _raise_for_error(result: Any) -> None:
+        error_message = result.content
+        try:
+            error_json = result.json()
+            for k in ("message", "error"):
+                if k in error_json:
+                    error_message = error_json[k]
+        except (KeyError, ValueError, TypeError):
+            pass
+
+        if result.status_code == 401:
+            raise gitlab.exceptions.GitlabAuthenticationError(
+                response_code=result.status_code,
+                error_message=error_message,
+                response_body=result.content,
+            )
+
+        raise gitlab.exceptions.GitlabHttpError(
+            response_code=result.status_code,
+            error_message=error_message,
+            response_body=result.content,
+        )
+
     def http_request(
         self,
         verb: str,
@@ -616,6 +803,7 @@ class Gitlab:
         timeout: Optional[float] = None,
         obey_rate_limit: bool = True,
         max_retries: int = 10,
+        use_etag_cache: bool = False,
         **kwargs: Any,
     ) -> requests.Response:
         """Make an HTTP request to the Gitlab server.
@@ -635,6 +823,11 @@ class Gitlab:
                                     responses. Defaults to True.
             max_retries: Max retries after 429 or transient errors,
                                set to -1 to retry forever. Defaults to 10.
+            use_etag_cache: For non-streamed GET requests, keep the responses
+                that have an ETag and revalidate them with If-None-Match. If
+                the server answers 304 Not Modified, a response is rebuilt from
+                the kept one without transferring the body again. Bodies over
+                1 MiB are not kept.
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Returns:
@@ -643,25 +836,9 @@ class Gitlab:
         Raises:
             GitlabHttpError: When the return code is not 2xx
         """
-        query_data = query_data or {}
         url = self._build_url(path)
-
-        params: Dict[str, Any] = {}
-        utils.copy_dict(src=query_data, dest=params)
-
-        # Deal with kwargs: by default a user uses kwargs to send data to the
-        # gitlab server, but this generates problems (python keyword conflicts
-        # and python-gitlab/gitlab conflicts).
-        # So we provide a `query_parameters` key: if it's there we use its dict
-        # value as arguments for the gitlab server, and ignore the other
-        # arguments, except pagination ones (per_page and page)
-        if "query_parameters" in kwargs:
-            utils.copy_dict(src=kwargs["query_parameters"], dest=params)
-            for arg in ("per_page", "page"):
-                if arg in kwargs:
-                    params[arg] = kwargs[arg]
-        else:
-            utils.copy_dict(src=kwargs, dest=params)
+        # Encode the parameters once, not on every retry
+        params = utils.encode_query_params(self._get_query_params(query_data, kwargs))
 
         opts = self._get_session_opts()
 
@@ -675,6 +852,14 @@ class Gitlab:
         json, data, content_type = self._prepare_send_data(files, post_data, raw)
         opts["headers"]["Content-type"] = content_type
 
+        cache_key = None
+        cached = None
+        if use_etag_cache and verb == "get" and not streamed:
+            cache_key = (url, params)
+            cached = self._get_etag_cached(cache_key)
+            if cached is not None:
+                opts["headers"]["If-None-Match"] = cached.etag
+
         cur_retries = 0
         while True:
             result = self.session.request(
@@ -691,48 +876,23 @@ class Gitlab:
 
             self._check_redirects(result)
 
+            if cached is not None and result.status_code == 304:
+                return cached.to_response(result)
+
             if 200 <= result.status_code < 300:
+                if cache_key is not None and "ETag" in result.headers:
+                    self._set_etag_cached(cache_key, result)
                 return result
 
-            retry_transient_errors = kwargs.get(
-                "retry_transient_errors", self.retry_transient_errors
-            )
-            if (429 == result.status_code and obey_rate_limit) or (
-                result.status_code in [500, 502, 503, 504] and retry_transient_errors
+            if self._should_retry(
+                result, obey_rate_limit, max_retries, cur_retries, kwargs
             ):
-                # Response headers documentation:
-                # https://docs.gitlab.com/ee/user/admin_area/settings/user_and_ip_rate_limits.html#response-headers
-                if max_retries == -1 or cur_retries < max_retries:
-                    wait_time = 2**cur_retries * 0.1
-                    if "Retry-After" in result.headers:
-                        wait_time = int(result.headers["Retry-After"])
-                    elif "RateLimit-Reset" in result.headers:
-                        wait_time = int(result.headers["RateLimit-Reset"]) - time.time()
-                    cur_retries += 1
-                    time.sleep(wait_time)
-                    continue
-
-            error_message = result.content
-            try:
-                error_json = result.json()
-                for k in ("message", "error"):
-                    if k in error_json:
-                        error_message = error_json[k]
-            except (KeyError, ValueError, TypeError):
-                pass
-
-            if result.status_code == 401:
-                raise gitlab.exceptions.GitlabAuthenticationError(
-                    response_code=result.status_code,
-                    error_message=error_message,
-                    response_body=result.content,
-                )
+                wait_time = self._get_retry_wait_time(result, cur_retries)
+                cur_retries += 1
+                time.sleep(wait_time)
+                continue
 
-            raise gitlab.exceptions.GitlabHttpError(
-                response_code=result.status_code,
-                error_message=error_message,
-                response_body=result.content,
-            )
+            self._raise_for_error(result)
 
     def http_get(
         self,
@@ -750,6 +910,8 @@ class Gitlab:
             query_data: Data to send as query parameters
             streamed: Whether the data should be streamed
             raw: If True do not try to parse the output as json
+            use_etag_cache: Revalidate a previous response with its ETag, see
+                :meth:`http_request`. Defaults to False.
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Returns:
@@ -772,7 +934,7 @@ class Gitlab:
             and not raw
         ):
             try:
-                return result.json()
+                return utils.json_loads(result)
             except Exception as e:
                 raise gitlab.exceptions.GitlabParsingError(
                     error_message="Failed to parse the server message"
@@ -793,6 +955,13 @@ class Gitlab:
             path: Path or full URL to query ('/projects' or
                         'http://whatever/v4/api/projects')
             query_data: Data to send as query parameters
+            as_list: If set to False and no pagination option is defined,
+                return a GitlabList generator instead of a list
+            prefetch_pages: When iterating over several pages, number of pages
+                fetched in a background thread ahead of the current one.
+                Defaults to 0 (disabled).
+            use_etag_cache: Revalidate previous responses with their ETag, see
+                :meth:`http_request`. Defaults to False.
             **kwargs: Extra options to send to the server (e.g. sudo, page,
                       per_page)
 
@@ -960,12 +1129,377 @@ class Gitlab:
         data = {"scope": scope, "search": search}
         return self.http_list("/search", query_data=data, **kwargs)
 
+    def _init_async_clients(self) -> None:
+        # One client and semaphore per event loop. The loops are referenced
+        # until they are closed, so that their clients are always closed too.
+        self._async_clients: Dict["asyncio.AbstractEventLoop", "_AsyncClientEntry"] = {}
+        self._async_clients_lock = threading.Lock()
+
+    def _pop_closed_loops_clients(self) -> List["httpx.AsyncClient"]:
+        with self._async_clients_lock:
+            closed = [loop for loop in self._async_clients if loop.is_closed()]
+            return [self._async_clients.pop(loop)[0] for loop in closed]
+
+    @staticmethod
+    async def _close_async_clients(clients: List["httpx.AsyncClient"]) -> None:
+        for client in clients:
+            try:
+                await client.aclose()
+            except RuntimeError:
+                # The connections belong to an event loop that is closed, the
+                # client is closed anyway and the sockets are released.
+                pass
+
+    async def _get_async_client(self) -> "_AsyncClientEntry":
+        """Return the asynchronous client bound to the running event loop, and
+        the semaphore limiting its requests in flight.
+
+        httpx clients cannot be shared between event loops, so a client is
+        created for each running loop (e.g. for each ``asyncio.run()`` call or
+        thread running its own loop). The clients left behind by loops that
+        are closed are closed at the same time.
+
+        Raises:
+            ModuleNotFoundError: If httpx is not installed
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ModuleNotFoundError(
+                "httpx is not installed.\n"
+                "Install it with `pip install python-gitlab[async]`",
+                name="httpx",
+            ) from e
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            entry = self._async_clients.get(loop)
+        if entry is not None:
+            return entry
+
+        await self._close_async_clients(self._pop_closed_loops_clients())
+
+        auth = None
+        if self.http_username:
+            auth = httpx.BasicAuth(self.http_username, self.http_password or "")
+        client = httpx.AsyncClient(
+            http2=True,
+            # Keep the connections alive between bursts of requests, the
+            # semaphore below caps the number of requests in flight.
+            limits=httpx.Limits(
+                max_connections=2 * self.pool_size,
+                max_keepalive_connections=self.pool_size,
+            ),
+            auth=auth,
+            verify=self.ssl_verify,
+            follow_redirects=True,
+        )
+        entry = (client, asyncio.Semaphore(gitlab.const.ASYNC_CONCURRENCY))
+        with self._async_clients_lock:
+            self._async_clients[loop] = entry
+        return entry
+
+    async def aclose(self) -> None:
+        """Close the asynchronous client of the running event loop, if it was
+        created, and the clients left behind by closed event loops.
+
+        Clients used by other running event loops must be closed from these
+        loops.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            entry = self._async_clients.pop(loop, None)
+        clients = self._pop_closed_loops_clients()
+        if entry is not None:
+            clients.append(entry[0])
+        await self._close_async_clients(clients)
+
+    def _check_async_redirects(self, result: "httpx.Response") -> None:
+        # See _check_redirects()
+        for item in result.history:
+            if item.status_code not in (301, 302):
+                continue
+            if item.request.method == "GET":
+                continue
+            target = item.headers.get("location")
+            raise gitlab.exceptions.RedirectError(
+                REDIRECT_MSG.format(
+                    status_code=item.status_code,
+                    reason=item.reason_phrase,
+                    source=str(item.url),
+                    target=target,
+                )
+            )
+
+    async def a_http_request(
+        self,
+        verb: str,
+        path: str,
+        query_data: Optional[Dict[str, Any]] = None,
+        post_data: Optional[Union[Dict[str, Any], bytes]] = None,
+        raw: bool = False,
+        streamed: bool = False,
+        timeout: Optional[float] = None,
+        obey_rate_limit: bool = True,
+        max_retries: int = 10,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """Make an asynchronous HTTP request to the Gitlab server.
+
+        This is the ``httpx`` counterpart of :meth:`http_request`. At most
+        ``gitlab.const.ASYNC_CONCURRENCY`` requests are waiting for a response
+        at the same time, to stay within the GitLab rate limits. With
+        ``streamed=True``, the limit is released once the headers are
+        received: the body is downloaded outside of it.
+
+        Args:
+            verb: The HTTP method to call ('get', 'post', 'put', 'delete')
+            path: Path or full URL to query ('/projects' or
+                        'http://whatever/v4/api/projecs')
+            query_data: Data to send as query parameters
+            post_data: Data to send in the body (will be converted to
+                              json by default)
+            raw: If True, do not convert post_data to json
+            streamed: Whether the data should be streamed. The caller is then
+                responsible for closing the response.
+            timeout: The timeout, in seconds, for the request
+            obey_rate_limit: Whether to obey 429 Too Many Request
+                                    responses. Defaults to True.
+            max_retries: Max retries after 429 or transient errors,
+                               set to -1 to retry forever. Defaults to 10.
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
+        Returns:
+            An httpx response object.
+
+        Raises:
+            GitlabHttpError: When the return code is not 2xx
+        """
+        import asyncio
+
+        client, semaphore = await self._get_async_client()
+        url = self._build_url(path)
+        params = utils.encode_query_params(self._get_query_params(query_data, kwargs))
+        # Unlike requests, httpx replaces the query string of the URL (e.g. of
+        # the next page) with params, append them instead
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{params}"
+
+        opts = self._get_session_opts()
+        if timeout is None:
+            timeout = opts["timeout"]
+
+        json, data, content_type = self._prepare_send_data(None, post_data, raw)
+        opts["headers"]["Content-type"] = content_type
+
+        cur_retries = 0
+        while True:
+            request = client.build_request(
+                verb,
+                url,
+                json=json,
+                content=cast(Optional[bytes], data),
+                headers=opts["headers"],
+                timeout=timeout,
+            )
+            async with semaphore:
+                result = await client.send(request, stream=streamed)
+
+            self._check_async_redirects(result)
+
+            if 200 <= result.status_code < 300:
+                return result
+
+            # Streamed error responses must be read before they can be parsed
+            await result.aread()
+
+            if self._should_retry(
+                result, obey_rate_limit, max_retries, cur_retries, kwargs
+            ):
+                wait_time = self._get_retry_wait_time(result, cur_retries)
+                cur_retries += 1
+                await asyncio.sleep(wait_time)
+                continue
+
+            self._raise_for_error(result)
+
+    async def a_http_get(
+        self,
+        path: str,
+        query_data: Optional[Dict[str, Any]] = None,
+        streamed: bool = False,
+        raw: bool = False,
+        **kwargs: Any,
+    ) -> Union[Dict[str, Any], "httpx.Response"]:
+        """Make an asynchronous GET request to the Gitlab server.
+
+        See :meth:`http_get` for the arguments and return values.
+        """
+        result = await self.a_http_request(
+            "get", path, query_data=query_data, streamed=streamed, **kwargs
+        )
+
+        if (
+            result.headers["Content-Type"] == "application/json"
+            and not streamed
+            and not raw
+        ):
+            try:
+                return utils.json_loads(result)
+            except Exception as e:
+                raise gitlab.exceptions.GitlabParsingError(
+                    error_message="Failed to parse the server message"
+                ) from e
+        else:
+            return result
+
+    async def a_http_list(
+        self,
+        path: str,
+        query_data: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """Make an asynchronous GET request for list-oriented queries.
+
+        Unlike :meth:`http_list`, a list is always returned. If ``all`` is
+        True, the pages are followed until the last one.
+
+        Raises:
+            GitlabHttpError: When the return code is not 2xx
+            GitlabParsingError: If the json data could not be parsed
+        """
+        get_all = kwargs.pop("all", False)
+        kwargs.pop("as_list", None)
+        url: Optional[str] = self._build_url(path)
+        items: List[Dict[str, Any]] = []
+        while url:
+            result = await self.a_http_request(
+                "get", url, query_data=query_data, **kwargs
+            )
+            try:
+                items.extend(utils.json_loads(result))
+            except Exception as e:
+                raise gitlab.exceptions.GitlabParsingError(
+                    error_message="Failed to parse the server message"
+                ) from e
+            url = result.links.get("next", {}).get("url") if get_all else None
+            # The next URL already contains the query parameters, sending the
+            # page again would replace the one of the next URL
+            query_data = None
+            kwargs.pop("query_parameters", None)
+            kwargs.pop("page", None)
+            kwargs.pop("per_page", None)
+        return items
+
+    async def a_http_post(
+        self,
+        path: str,
+        query_data: Optional[Dict[str, Any]] = None,
+        post_data: Optional[Dict[str, Any]] = None,
+        raw: bool = False,
+        **kwargs: Any,
+    ) -> Union[Dict[str, Any], "httpx.Response"]:
+        """Make an asynchronous POST request to the Gitlab server.
+
+        See :meth:`http_post` for the arguments and return values.
+        """
+        result = await self.a_http_request(
+            "post",
+            path,
+            query_data=query_data,
+            post_data=post_data or {},
+            raw=raw,
+            **kwargs,
+        )
+        try:
+            if result.headers.get("Content-Type", None) == "application/json":
+                return result.json()
+        except Exception as e:
+            raise gitlab.exceptions.GitlabParsingError(
+                error_message="Failed to parse the server message"
+            ) from e
+        return result
+
+    async def a_http_put(
+        self,
+        path: str,
+        query_data: Optional[Dict[str, Any]] = None,
+        post_data: Optional[Union[Dict[str, Any], bytes]] = None,
+        raw: bool = False,
+        **kwargs: Any,
+    ) -> Union[Dict[str, Any], "httpx.Response"]:
+        """Make an asynchronous PUT request to the Gitlab server.
+
+        See :meth:`http_put` for the arguments and return values.
+        """
+        result = await self.a_http_request(
+            "put",
+            path,
+            query_data=query_data,
+            post_data=post_data or {},
+            raw=raw,
+            **kwargs,
+        )
+        try:
+            return result.json()
+        except Exception as e:
+            raise gitlab.exceptions.GitlabParsingError(
+                error_message="Failed to parse the server message"
+            ) from e
+
+    async def a_http_delete(self, path: str, **kwargs: Any) -> "httpx.Response":
+        """Make an asynchronous DELETE request to the Gitlab server.
+
+        See :meth:`http_delete` for the arguments and return values.
+        """
+        return await self.a_http_request("delete", path, **kwargs)
+
+
+def _fetch_pages(
+    gl: Gitlab,
+    url: str,
+    kwargs: Dict[str, Any],
+    pages: "queue.Queue[Union[requests.Response, Exception]]",
+    stop: threading.Event,
+) -> None:
+    """Fetch the pages of a list, starting at ``url``, ahead of the consumer.
+
+    Pages (or the exception raised while fetching one) are put in ``pages``,
+    whose size bounds how far ahead we go. Runs until the last page is fetched
+    or ``stop`` is set.
+    """
+    next_url: Optional[str] = url
+    while next_url and not stop.is_set():
+        result: Union[requests.Response, Exception]
+        try:
+            result = gl.http_request("get", next_url, **kwargs)
+        except Exception as e:
+            result = e
+        while not stop.is_set():
+            try:
+                pages.put(result, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        if isinstance(result, Exception):
+            return
+        next_url = GitlabList._get_next_url(result)
+
 
 class GitlabList:
     """Generator representing a list of remote objects.
 
     The object handles the links returned by a query to the API, and will call
     the API again when needed.
+
+    If ``prefetch_pages`` is set, the next pages are fetched in a background
+    thread (at most ``prefetch_pages`` pages ahead) while the current one is
+    being consumed. Each prefetched page is a request counted by the GitLab
+    rate limits, even if the iteration is stopped early.
     """
 
     def __init__(
@@ -974,6 +1508,7 @@ class GitlabList:
         url: str,
         query_data: Dict[str, Any],
         get_next: bool = True,
+        prefetch_pages: int = 0,
         **kwargs: Any,
     ) -> None:
         self._gl = gl
@@ -987,22 +1522,43 @@ class GitlabList:
         # Remove query_parameters from kwargs, which are saved via the `next` URL
         self._kwargs.pop("query_parameters", None)
 
+        self._pages: Optional["queue.Queue[Union[requests.Response, Exception]]"]
+        self._pages = None
+        if prefetch_pages > 0 and get_next is True and self._next_url:
+            self._start_prefetch(self._next_url, prefetch_pages)
+
+    def _start_prefetch(self, url: str, prefetch_pages: int) -> None:
+        self._pages = queue.Queue(maxsize=prefetch_pages)
+        stop = threading.Event()
+        # A daemon thread, so that an abandoned list never blocks the exit of
+        # the interpreter. The thread stops once the list is garbage collected.
+        thread = threading.Thread(
+            target=_fetch_pages,
+            args=(self._gl, url, self._kwargs.copy(), self._pages, stop),
+            daemon=True,
+        )
+        weakref.finalize(self, stop.set)
+        thread.start()
+
+    @staticmethod
+    def _get_next_url(result: requests.Response) -> Optional[str]:
+        try:
+            links = result.links
+            if links:
+                return links["next"]["url"]
+            return requests.utils.parse_header_links(result.headers["links"])[0]["url"]
+        except KeyError:
+            return None
+
     def _query(
         self, url: str, query_data: Optional[Dict[str, Any]] = None, **kwargs: Any
     ) -> None:
         query_data = query_data or {}
         result = self._gl.http_request("get", url, query_data=query_data, **kwargs)
-        try:
-            links = result.links
-            if links:
-                next_url = links["next"]["url"]
-            else:
-                next_url = requests.utils.parse_header_links(result.headers["links"])[
-                    0
-                ]["url"]
-            self._next_url = next_url
-        except KeyError:
-            self._next_url = None
+        self._process_result(result)
+
+    def _process_result(self, result: requests.Response) -> None:
+        self._next_url = self._get_next_url(result)
         self._current_page: Optional[str] = result.headers.get("X-Page")
         self._prev_page: Optional[str] = result.headers.get("X-Prev-Page")
         self._next_page: Optional[str] = result.headers.get("X-Next-Page")
@@ -1011,7 +1567,7 @@ class GitlabList:
         self._total: Optional[str] = result.headers.get("X-Total")
 
         try:
-            self._data: List[Dict[str, Any]] = result.json()
+            self._data: List[Dict[str, Any]] = utils.json_loads(result)
         except Exception as e:
             raise gitlab.exceptions.GitlabParsingError(
                 error_message="Failed to parse the server message"
@@ -1084,7 +1640,13 @@ class GitlabList:
             pass
 
         if self._next_url and self._get_next is True:
-            self._query(self._next_url, **self._kwargs)
+            if self._pages is not None:
+                result = self._pages.get()
+                if isinstance(result, Exception):
+                    raise result
+                self._process_result(result)
+            else:
+                self._query(self._next_url, **self._kwargs)
             return self.next()
 
         raise StopIteration
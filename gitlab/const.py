@@ -91,3 +91,23 @@ SEARCH_SCOPE_GLOBAL_SNIPPET_TITLES: str = "snippet_titles"
 SEARCH_SCOPE_PROJECT_NOTES: str = "notes"
 
 USER_AGENT: str = f"{__title__}/{__version__}"
+
+# Default chunk size for streamed downloads. Iterating over 1 KiB chunks spends
+# most of the time in Python, gains flatten out around 100 KiB.
+DEFAULT_STREAM_CHUNK_SIZE: int = 100 * 1024
+
+# Maximum number of requests in flight for the asynchronous client. GitLab.com
+# rate limits authenticated API traffic, so keep this low.
+ASYNC_CONCURRENCY: int = 10
+
+# Default number of pooled connections to the GitLab server. requests keeps
+# only 10 by default, which makes threads calling the API concurrently open and
+# close connections over and over.
+DEFAULT_POOL_SIZE: int = 32
+
+# Limits of the responses kept for conditional requests (ETag/If-None-Match):
+# number of responses, total size of their bodies, and size of a single body
+# (larger bodies are not kept).
+ETAG_CACHE_SIZE: int = 128
+ETAG_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+ETAG_CACHE_MAX_ENTRY_BYTES: int = 1024 * 1024
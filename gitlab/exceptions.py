@@ -16,6 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import functools
+import inspect
 from typing import Any, Callable, cast, Optional, Type, TYPE_CHECKING, TypeVar, Union
 
 
@@ -305,6 +306,19 @@ def on_http_error(error: Type[Exception]) -> Callable[[__F], __F]:
     """
 
     def wrap(f: __F) -> __F:
+        if inspect.iscoroutinefunction(f):
+
+            @functools.wraps(f)
+            async def async_wrapped_f(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await f(*args, **kwargs)
+                except GitlabHttpError as e:
+                    raise error(
+                        e.error_message, e.response_code, e.response_body
+                    ) from e
+
+            return cast(__F, async_wrapped_f)
+
         @functools.wraps(f)
         def wrapped_f(*args: Any, **kwargs: Any) -> Any:
             try:
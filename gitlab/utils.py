@@ -15,25 +15,117 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
+import io
+import os
 import pathlib
 import traceback
 import urllib.parse
 import warnings
-from typing import Any, Callable, Dict, Optional, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+    Union,
+)
 
 import requests
 
+if TYPE_CHECKING:
+    import httpx
+
 
 class _StdoutStream:
     def __call__(self, chunk: Any) -> None:
         print(chunk)
 
 
+class _VectoredFileWriter:
+    """Write chunks to a binary file in batches, with one ``os.writev()`` call
+    per ``batch_size`` chunks instead of one ``write()`` call per chunk."""
+
+    def __init__(
+        self,
+        file: Union[io.BufferedWriter, io.BufferedRandom, io.FileIO],
+        batch_size: int,
+    ) -> None:
+        # Data already buffered by the file object must reach the file first
+        file.flush()
+        self._file = file
+        self._fd = file.fileno()
+        self._batch_size = batch_size
+        # Pipes, sockets and terminals have no position to resynchronize
+        self._seekable = file.seekable()
+        self._chunks: List[bytes] = []
+
+    def __call__(self, chunk: bytes) -> None:
+        self._chunks.append(chunk)
+        if len(self._chunks) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        buffers = [memoryview(chunk) for chunk in self._chunks]
+        self._chunks = []
+        while buffers:
+            written = os.writev(self._fd, buffers)
+            # Deal with partial writes
+            while buffers and written >= len(buffers[0]):
+                written -= len(buffers.pop(0))
+            if written:
+                buffers[0] = buffers[0][written:]
+
+    def close(self) -> None:
+        self.flush()
+        if self._seekable:
+            # Resynchronize the position of the file object with the descriptor
+            self._file.seek(0, os.SEEK_CUR)
+
+
+def _get_iov_max() -> int:
+    """Return the maximum number of buffers accepted by ``os.writev()``."""
+    try:
+        iov_max = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, ValueError, OSError):
+        iov_max = -1
+    # 16 is the minimum guaranteed by POSIX (_XOPEN_IOV_MAX)
+    return iov_max if iov_max > 0 else 16
+
+
+def _get_vectored_writer(
+    action: Callable, batch_size: int
+) -> Optional[_VectoredFileWriter]:
+    """Return a vectored writer if ``action`` is the ``write`` method of a binary
+    file, None otherwise.
+
+    Only actual files qualify: other objects with a ``fileno()`` (e.g.
+    ``gzip.GzipFile``) transform the data before it reaches the descriptor.
+    """
+    if not hasattr(os, "writev"):
+        return None
+    file = getattr(action, "__self__", None)
+    if getattr(action, "__name__", None) != "write" or not isinstance(
+        file, (io.BufferedWriter, io.BufferedRandom, io.FileIO)
+    ):
+        return None
+    try:
+        # e.g. a buffered writer wrapping an in-memory stream
+        file.fileno()
+    except (OSError, io.UnsupportedOperation):
+        return None
+    return _VectoredFileWriter(file, min(batch_size, _get_iov_max()))
+
+
 def response_content(
     response: requests.Response,
     streamed: bool,
     action: Optional[Callable],
     chunk_size: int,
+    writev_batch_size: int = 0,
 ) -> Optional[bytes]:
     if streamed is False:
         return response.content
@@ -41,12 +133,72 @@ def response_content(
     if action is None:
         action = _StdoutStream()
 
-    for chunk in response.iter_content(chunk_size=chunk_size):
-        if chunk:
-            action(chunk)
+    # If the chunks end up in a file, group the writes to save system calls
+    writer = None
+    if writev_batch_size > 1:
+        writer = _get_vectored_writer(action, writev_batch_size)
+    if writer is not None:
+        action = writer
+
+    # Release the connection even if the action fails mid-stream
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            if chunk:
+                action(chunk)
+    finally:
+        response.close()
+        if writer is not None:
+            writer.close()
     return None
 
 
+async def aresponse_content(
+    response: "httpx.Response",
+    streamed: bool,
+    action: Optional[Callable],
+    chunk_size: int,
+) -> Optional[bytes]:
+    if streamed is False:
+        return response.content
+
+    if action is None:
+        action = _StdoutStream()
+
+    try:
+        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+            if chunk:
+                action(chunk)
+    finally:
+        await response.aclose()
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_orjson() -> Any:
+    """Return the orjson module, or None if it is not installed.
+
+    It is imported on first use rather than with this module, to keep it out
+    of the time taken by ``import gitlab``.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def json_loads(response: Union[requests.Response, "httpx.Response"]) -> Any:
+    """Decode the JSON body of a response, using orjson if it is installed."""
+    orjson = _get_orjson()
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # orjson only accepts UTF-8, requests also detects other encodings
+            pass
+    return response.json()
+
+
 def copy_dict(
     *,
     src: Dict[str, Any],
@@ -91,6 +243,21 @@ class EncodedId(str):
         return super().__new__(cls, value)
 
 
+def encode_query_params(params: Dict[str, Any]) -> str:
+    """Encode query parameters the same way ``requests`` does.
+
+    ``None`` values are skipped and list or tuple values are sent as repeated
+    keys. Encoding once up front avoids re-encoding the same parameters on
+    every retry of a request.
+    """
+    items: List[Tuple[str, Any]] = []
+    for key, values in params.items():
+        if isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+            values = [values]
+        items.extend((key, value) for value in values if value is not None)
+    return urllib.parse.urlencode(items, doseq=True)
+
+
 def remove_none_from_dict(data: Dict[str, Any]) -> Dict[str, Any]:
     return {k: v for k, v in data.items() if v is not None}
 
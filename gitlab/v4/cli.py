@@ -320,6 +320,8 @@ def _populate_sub_parser_by_class(
 
 
 def extend_parser(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    cli._register_pending_actions()
+
     subparsers = parser.add_subparsers(
         title="object", dest="what", help="Object to manipulate."
     )
@@ -3,9 +3,21 @@ GitLab API: https://docs.gitlab.com/ee/api/repositories.html
 
 Currently this module only contains repository-related methods for projects.
 """
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Union
-
-import requests
+import concurrent.futures
+import functools
+import os
+import pathlib
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TYPE_CHECKING,
+    Union,
+)
 
 import gitlab
 from gitlab import cli
@@ -13,18 +25,43 @@ from gitlab import exceptions as exc
 from gitlab import utils
 
 if TYPE_CHECKING:
+    # Only needed for type annotations, keep them out of the import path
+    import httpx
+    import requests
+
     # When running mypy we use these as the base classes
     _RestObjectBase = gitlab.base.RESTObject
 else:
     _RestObjectBase = object
 
+# The same submodule paths tend to be updated over and over, only url-encode
+# each of them once. typed=True keeps a raw str and an already encoded
+# EncodedId with the same value apart, so nothing gets encoded twice.
+_encode = functools.lru_cache(maxsize=4096, typed=True)(utils.EncodedId)
+
 
 class RepositoryMixin(_RestObjectBase):
+    @property
+    def _repo_path(self) -> str:
+        """The ``/projects/:id/repository`` prefix, computed once per project
+        ID."""
+        # Url-encoding the ID on every call is wasted work, cache the prefix
+        # along with the ID it was built from: the ID changes when a lazy
+        # object is refreshed or saved (e.g. from a path to a numeric ID).
+        # functools.cached_property cannot be used with python 3.7.
+        obj_id = self.get_id()
+        cached = self.__dict__.get("_repo_path_cache")
+        if cached is not None and cached[0] == obj_id:
+            return cached[1]
+        repo_path = f"/projects/{self.encoded_id}/repository"
+        self.__dict__["_repo_path_cache"] = (obj_id, repo_path)
+        return repo_path
+
     @cli.register_custom_action("Project", ("submodule", "branch", "commit_sha"))
     @exc.on_http_error(exc.GitlabUpdateError)
     def update_submodule(
         self, submodule: str, branch: str, commit_sha: str, **kwargs: Any
-    ) -> Union[Dict[str, Any], requests.Response]:
+    ) -> Union[Dict[str, Any], "requests.Response"]:
         """Update a project submodule
 
         Args:
@@ -39,24 +76,39 @@ class RepositoryMixin(_RestObjectBase):
             GitlabPutError: If the submodule could not be updated
         """
 
-        submodule = utils.EncodedId(submodule)
-        path = f"/projects/{self.encoded_id}/repository/submodules/{submodule}"
-        data = {"branch": branch, "commit_sha": commit_sha}
-        if "commit_message" in kwargs:
-            data["commit_message"] = kwargs["commit_message"]
+        submodule = _encode(submodule)
+        path = f"{self._repo_path}/submodules/{submodule}"
+        data = utils.remove_none_from_dict(
+            {
+                "branch": branch,
+                "commit_sha": commit_sha,
+                "commit_message": kwargs.get("commit_message"),
+            }
+        )
         return self.manager.gitlab.http_put(path, post_data=data)
 
     @cli.register_custom_action("Project", (), ("path", "ref", "recursive"))
     @exc.on_http_error(exc.GitlabGetError)
     def repository_tree(
-        self, path: str = "", ref: str = "", recursive: bool = False, **kwargs: Any
-    ) -> Union[gitlab.client.GitlabList, List[Dict[str, Any]]]:
+        self,
+        path: str = "",
+        ref: str = "",
+        recursive: bool = False,
+        prefetch_pages: int = 1,
+        use_etag_cache: bool = True,
+        **kwargs: Any,
+    ) -> Union["gitlab.client.GitlabList", List[Dict[str, Any]]]:
         """Return a list of files in the repository.
 
         Args:
             path: Path of the top folder (/ by default)
             ref: Reference to a commit or branch
             recursive: Whether to get the tree recursively
+            prefetch_pages: When iterating over several pages (`all` or
+                `as_list=False`), number of pages fetched in the background
+                ahead of the current one. Set to 0 to disable.
+            use_etag_cache: Revalidate a previous response with its ETag, so
+                that an unchanged result is not transferred again.
             all: If True, return all the items, without pagination
             per_page: Number of items to retrieve per request
             page: ID of the page to return (starts with page 1)
@@ -71,23 +123,32 @@ class RepositoryMixin(_RestObjectBase):
         Returns:
             The representation of the tree
         """
-        gl_path = f"/projects/{self.encoded_id}/repository/tree"
-        query_data: Dict[str, Any] = {"recursive": recursive}
-        if path:
-            query_data["path"] = path
-        if ref:
-            query_data["ref"] = ref
-        return self.manager.gitlab.http_list(gl_path, query_data=query_data, **kwargs)
+        gl_path = f"{self._repo_path}/tree"
+        # path and ref are only sent when set (the server defaults apply)
+        query_data: Dict[str, Any] = {
+            "recursive": recursive,
+            **{k: v for k, v in {"path": path, "ref": ref}.items() if v},
+        }
+        return self.manager.gitlab.http_list(
+            gl_path,
+            query_data=query_data,
+            prefetch_pages=prefetch_pages,
+            use_etag_cache=use_etag_cache,
+            **kwargs,
+        )
 
     @cli.register_custom_action("Project", ("sha",))
     @exc.on_http_error(exc.GitlabGetError)
     def repository_blob(
-        self, sha: str, **kwargs: Any
-    ) -> Union[Dict[str, Any], requests.Response]:
+        self, sha: str, use_etag_cache: bool = False, **kwargs: Any
+    ) -> Union[Dict[str, Any], "requests.Response"]:
         """Return a file by blob SHA.
 
         Args:
             sha: ID of the blob
+            use_etag_cache: Revalidate a previous response with its ETag, so
+                that an unchanged result is not transferred again. Disabled
+                by default, as the content of a blob cannot change for a SHA.
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Raises:
@@ -98,8 +159,57 @@ class RepositoryMixin(_RestObjectBase):
             The blob content and metadata
         """
 
-        path = f"/projects/{self.encoded_id}/repository/blobs/{sha}"
-        return self.manager.gitlab.http_get(path, **kwargs)
+        path = f"{self._repo_path}/blobs/{sha}"
+        return self.manager.gitlab.http_get(
+            path, use_etag_cache=use_etag_cache, **kwargs
+        )
+
+    def repository_blobs(
+        self,
+        shas: Iterable[str],
+        max_concurrency: int = gitlab.const.ASYNC_CONCURRENCY,
+        **kwargs: Any,
+    ) -> List[Union[Dict[str, Any], "httpx.Response"]]:
+        """Return several files by blob SHA, fetched concurrently.
+
+        The requests are sent with the asynchronous client (this requires
+        httpx, see :ref:`the async extra <async_requests>`). This method runs
+        its own event loop, in a separate thread if an event loop is already
+        running in this one (e.g. in Jupyter). Prefer
+        :meth:`a_repository_blobs` from a coroutine.
+
+        Args:
+            shas: IDs of the blobs
+            max_concurrency: Maximum number of requests in flight. It can only
+                lower the limit of ``gitlab.const.ASYNC_CONCURRENCY`` that
+                applies to all the asynchronous requests, as GitLab.com rate
+                limits API requests.
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
+        Raises:
+            GitlabAuthenticationError: If authentication is not correct
+            GitlabGetError: If the server failed to perform the request
+
+        Returns:
+            The blobs content and metadata, in the order of ``shas``
+        """
+
+        import asyncio
+
+        async def fetch_all() -> List[Union[Dict[str, Any], "httpx.Response"]]:
+            try:
+                return await self.a_repository_blobs(shas, max_concurrency, **kwargs)
+            finally:
+                # Only closes the client of the event loop that is about to close
+                await self.manager.gitlab.aclose()
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(fetch_all())
+        # asyncio.run() cannot be nested, use a loop in another thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(lambda: asyncio.run(fetch_all())).result()
 
     @cli.register_custom_action("Project", ("sha",))
     @exc.on_http_error(exc.GitlabGetError)
@@ -108,7 +218,7 @@ class RepositoryMixin(_RestObjectBase):
         sha: str,
         streamed: bool = False,
         action: Optional[Callable[..., Any]] = None,
-        chunk_size: int = 1024,
+        chunk_size: int = gitlab.const.DEFAULT_STREAM_CHUNK_SIZE,
         **kwargs: Any,
     ) -> Optional[bytes]:
         """Return the raw file contents for a blob.
@@ -120,7 +230,8 @@ class RepositoryMixin(_RestObjectBase):
                 treatment
             action: Callable responsible of dealing with chunk of
                 data
-            chunk_size: Size of each chunk
+            chunk_size: Size of each chunk (100 KiB by default, smaller chunks
+                make large downloads noticeably slower)
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Raises:
@@ -130,19 +241,19 @@ class RepositoryMixin(_RestObjectBase):
         Returns:
             The blob content if streamed is False, None otherwise
         """
-        path = f"/projects/{self.encoded_id}/repository/blobs/{sha}/raw"
+        path = f"{self._repo_path}/blobs/{sha}/raw"
         result = self.manager.gitlab.http_get(
             path, streamed=streamed, raw=True, **kwargs
         )
-        if TYPE_CHECKING:
-            assert isinstance(result, requests.Response)
-        return utils.response_content(result, streamed, action, chunk_size)
+        return utils.response_content(
+            cast("requests.Response", result), streamed, action, chunk_size
+        )
 
     @cli.register_custom_action("Project", ("from_", "to"))
     @exc.on_http_error(exc.GitlabGetError)
     def repository_compare(
         self, from_: str, to: str, **kwargs: Any
-    ) -> Union[Dict[str, Any], requests.Response]:
+    ) -> Union[Dict[str, Any], "requests.Response"]:
         """Return a diff between two branches/commits.
 
         Args:
@@ -157,18 +268,23 @@ class RepositoryMixin(_RestObjectBase):
         Returns:
             The diff
         """
-        path = f"/projects/{self.encoded_id}/repository/compare"
+        path = f"{self._repo_path}/compare"
         query_data = {"from": from_, "to": to}
         return self.manager.gitlab.http_get(path, query_data=query_data, **kwargs)
 
     @cli.register_custom_action("Project")
     @exc.on_http_error(exc.GitlabGetError)
     def repository_contributors(
-        self, **kwargs: Any
-    ) -> Union[gitlab.client.GitlabList, List[Dict[str, Any]]]:
+        self, prefetch_pages: int = 1, use_etag_cache: bool = True, **kwargs: Any
+    ) -> Union["gitlab.client.GitlabList", List[Dict[str, Any]]]:
         """Return a list of contributors for the project.
 
         Args:
+            prefetch_pages: When iterating over several pages (`all` or
+                `as_list=False`), number of pages fetched in the background
+                ahead of the current one. Set to 0 to disable.
+            use_etag_cache: Revalidate a previous response with its ETag, so
+                that an unchanged result is not transferred again.
             all: If True, return all the items, without pagination
             per_page: Number of items to retrieve per request
             page: ID of the page to return (starts with page 1)
@@ -183,8 +299,13 @@ class RepositoryMixin(_RestObjectBase):
         Returns:
             The contributors
         """
-        path = f"/projects/{self.encoded_id}/repository/contributors"
-        return self.manager.gitlab.http_list(path, **kwargs)
+        path = f"{self._repo_path}/contributors"
+        return self.manager.gitlab.http_list(
+            path,
+            prefetch_pages=prefetch_pages,
+            use_etag_cache=use_etag_cache,
+            **kwargs,
+        )
 
     @cli.register_custom_action("Project", (), ("sha", "format"))
     @exc.on_http_error(exc.GitlabListError)
@@ -193,8 +314,9 @@ class RepositoryMixin(_RestObjectBase):
         sha: str = None,
         streamed: bool = False,
         action: Optional[Callable[..., Any]] = None,
-        chunk_size: int = 1024,
+        chunk_size: int = gitlab.const.DEFAULT_STREAM_CHUNK_SIZE,
         format: Optional[str] = None,
+        writev_batch_size: int = 16,
         **kwargs: Any,
     ) -> Optional[bytes]:
         """Return an archive of the repository.
@@ -206,8 +328,12 @@ class RepositoryMixin(_RestObjectBase):
                 treatment
             action: Callable responsible of dealing with chunk of
                 data
-            chunk_size: Size of each chunk
+            chunk_size: Size of each chunk (100 KiB by default, smaller chunks
+                make large downloads noticeably slower)
             format: file format (tar.gz by default)
+            writev_batch_size: When `action` is the ``write`` method of a binary
+                file, number of chunks written at once with ``os.writev()``
+                (where available). Set to 0 to write the chunks one by one.
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Raises:
@@ -217,18 +343,79 @@ class RepositoryMixin(_RestObjectBase):
         Returns:
             The binary data of the archive
         """
-        path = f"/projects/{self.encoded_id}/repository/archive"
-        if format:
-            path += "." + format
+        suffix = f".{format}" if format else ""
+        path = f"{self._repo_path}/archive{suffix}"
         query_data = {}
         if sha:
             query_data["sha"] = sha
         result = self.manager.gitlab.http_get(
             path, query_data=query_data, raw=True, streamed=streamed, **kwargs
         )
-        if TYPE_CHECKING:
-            assert isinstance(result, requests.Response)
-        return utils.response_content(result, streamed, action, chunk_size)
+        return utils.response_content(
+            cast("requests.Response", result),
+            streamed,
+            action,
+            chunk_size,
+            writev_batch_size=writev_batch_size,
+        )
+
+    @staticmethod
+    def archive_many(
+        projects: Iterable["RepositoryMixin"],
+        dest_dir: Union[str, "os.PathLike[str]"],
+        max_workers: int = 8,
+        chunk_size: int = gitlab.const.DEFAULT_STREAM_CHUNK_SIZE,
+        format: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[pathlib.Path]:
+        """Download the archives of several projects concurrently.
+
+        Each archive is streamed to ``<dest_dir>/<project id>.<format>`` by a
+        pool of threads, so that the downloads overlap.
+
+        If a download fails, its partially written file is removed. The other
+        downloads still run to completion, then the error of the first failed
+        project (in the order of ``projects``) is raised. The archives that
+        were downloaded are left in ``dest_dir``.
+
+        Args:
+            projects: The projects to archive
+            dest_dir: Existing directory in which the archives are written
+            max_workers: Maximum number of archives downloaded at the same
+                time. Keep it low to stay within the GitLab rate limits.
+            chunk_size: Size of each chunk
+            format: file format (tar.gz by default)
+            **kwargs: Extra options passed to :meth:`repository_archive`
+                (e.g. sha)
+
+        Raises:
+            GitlabAuthenticationError: If authentication is not correct
+            GitlabListError: If the server failed to perform the request
+
+        Returns:
+            The paths of the archives, in the order of ``projects``
+        """
+        extension = format or "tar.gz"
+
+        def archive(project: "RepositoryMixin") -> pathlib.Path:
+            path = pathlib.Path(dest_dir) / f"{project.encoded_id}.{extension}"
+            try:
+                with open(path, "wb") as f:
+                    project.repository_archive(
+                        streamed=True,
+                        action=f.write,
+                        chunk_size=chunk_size,
+                        format=format,
+                        **kwargs,
+                    )
+            except Exception:
+                # Don't leave a truncated archive behind
+                path.unlink()
+                raise
+            return path
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(archive, projects))
 
     @cli.register_custom_action("Project")
     @exc.on_http_error(exc.GitlabDeleteError)
@@ -242,5 +429,139 @@ class RepositoryMixin(_RestObjectBase):
             GitlabAuthenticationError: If authentication is not correct
             GitlabDeleteError: If the server failed to perform the request
         """
-        path = f"/projects/{self.encoded_id}/repository/merged_branches"
+        path = f"{self._repo_path}/merged_branches"
         self.manager.gitlab.http_delete(path, **kwargs)
+
+    # Asynchronous variants of the methods above. They require the optional
+    # httpx dependency and can be awaited concurrently, e.g. with
+    # asyncio.gather(), to query many repositories at once.
+
+    @exc.on_http_error(exc.GitlabUpdateError)
+    async def a_update_submodule(
+        self, submodule: str, branch: str, commit_sha: str, **kwargs: Any
+    ) -> Union[Dict[str, Any], "httpx.Response"]:
+        """Asynchronous version of :meth:`update_submodule`."""
+        submodule = _encode(submodule)
+        path = f"{self._repo_path}/submodules/{submodule}"
+        data = utils.remove_none_from_dict(
+            {
+                "branch": branch,
+                "commit_sha": commit_sha,
+                "commit_message": kwargs.get("commit_message"),
+            }
+        )
+        return await self.manager.gitlab.a_http_put(path, post_data=data)
+
+    @exc.on_http_error(exc.GitlabGetError)
+    async def a_repository_tree(
+        self, path: str = "", ref: str = "", recursive: bool = False, **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """Asynchronous version of :meth:`repository_tree`.
+
+        A list is always returned, use ``all=True`` to fetch all the pages.
+        """
+        gl_path = f"{self._repo_path}/tree"
+        # path and ref are only sent when set (the server defaults apply)
+        query_data: Dict[str, Any] = {
+            "recursive": recursive,
+            **{k: v for k, v in {"path": path, "ref": ref}.items() if v},
+        }
+        return await self.manager.gitlab.a_http_list(
+            gl_path, query_data=query_data, **kwargs
+        )
+
+    @exc.on_http_error(exc.GitlabGetError)
+    async def a_repository_blob(
+        self, sha: str, **kwargs: Any
+    ) -> Union[Dict[str, Any], "httpx.Response"]:
+        """Asynchronous version of :meth:`repository_blob`."""
+        path = f"{self._repo_path}/blobs/{sha}"
+        return await self.manager.gitlab.a_http_get(path, **kwargs)
+
+    async def a_repository_blobs(
+        self,
+        shas: Iterable[str],
+        max_concurrency: int = gitlab.const.ASYNC_CONCURRENCY,
+        **kwargs: Any,
+    ) -> List[Union[Dict[str, Any], "httpx.Response"]]:
+        """Asynchronous version of :meth:`repository_blobs`.
+
+        ``max_concurrency`` can only lower the limit of
+        ``gitlab.const.ASYNC_CONCURRENCY`` requests in flight.
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(sha: str) -> Union[Dict[str, Any], "httpx.Response"]:
+            async with semaphore:
+                return await self.a_repository_blob(sha, **kwargs)
+
+        return list(await asyncio.gather(*(fetch(sha) for sha in shas)))
+
+    @exc.on_http_error(exc.GitlabGetError)
+    async def a_repository_raw_blob(
+        self,
+        sha: str,
+        streamed: bool = False,
+        action: Optional[Callable[..., Any]] = None,
+        chunk_size: int = gitlab.const.DEFAULT_STREAM_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Optional[bytes]:
+        """Asynchronous version of :meth:`repository_raw_blob`."""
+        path = f"{self._repo_path}/blobs/{sha}/raw"
+        result = await self.manager.gitlab.a_http_get(
+            path, streamed=streamed, raw=True, **kwargs
+        )
+        return await utils.aresponse_content(
+            cast("httpx.Response", result), streamed, action, chunk_size
+        )
+
+    @exc.on_http_error(exc.GitlabGetError)
+    async def a_repository_compare(
+        self, from_: str, to: str, **kwargs: Any
+    ) -> Union[Dict[str, Any], "httpx.Response"]:
+        """Asynchronous version of :meth:`repository_compare`."""
+        path = f"{self._repo_path}/compare"
+        query_data = {"from": from_, "to": to}
+        return await self.manager.gitlab.a_http_get(
+            path, query_data=query_data, **kwargs
+        )
+
+    @exc.on_http_error(exc.GitlabGetError)
+    async def a_repository_contributors(self, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Asynchronous version of :meth:`repository_contributors`.
+
+        A list is always returned, use ``all=True`` to fetch all the pages.
+        """
+        path = f"{self._repo_path}/contributors"
+        return await self.manager.gitlab.a_http_list(path, **kwargs)
+
+    @exc.on_http_error(exc.GitlabListError)
+    async def a_repository_archive(
+        self,
+        sha: str = None,
+        streamed: bool = False,
+        action: Optional[Callable[..., Any]] = None,
+        chunk_size: int = gitlab.const.DEFAULT_STREAM_CHUNK_SIZE,
+        format: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Optional[bytes]:
+        """Asynchronous version of :meth:`repository_archive`."""
+        suffix = f".{format}" if format else ""
+        path = f"{self._repo_path}/archive{suffix}"
+        query_data = {}
+        if sha:
+            query_data["sha"] = sha
+        result = await self.manager.gitlab.a_http_get(
+            path, query_data=query_data, raw=True, streamed=streamed, **kwargs
+        )
+        return await utils.aresponse_content(
+            cast("httpx.Response", result), streamed, action, chunk_size
+        )
+
+    @exc.on_http_error(exc.GitlabDeleteError)
+    async def a_delete_merged_branches(self, **kwargs: Any) -> None:
+        """Asynchronous version of :meth:`delete_merged_branches`."""
+        path = f"{self._repo_path}/merged_branches"
+        await self.manager.gitlab.a_http_delete(path, **kwargs)
@@ -50,7 +50,9 @@ setup(
         "Programming Language :: Python :: 3.10",
     ],
     extras_require={
+        "async": ["httpx[http2]>=0.22.0"],
         "autocompletion": ["argcomplete>=1.10.0,<3"],
+        "orjson": ["orjson>=3.0.0"],
         "yaml": ["PyYaml>=5.2"],
     },
 )
@@ -3,12 +3,17 @@ GitLab API:
 https://docs.gitlab.com/ee/api/repositories.html
 https://docs.gitlab.com/ee/api/repository_files.html
 """
+import asyncio
 from urllib.parse import quote
 
+import httpx
 import pytest
 import responses
+import respx
 
-from gitlab.v4.objects import ProjectFile
+import gitlab.const
+from gitlab import GitlabGetError, GitlabListError
+from gitlab.v4.objects import Project, ProjectFile
 
 file_path = "app/models/key.rb"
 ref = "main"
@@ -42,7 +47,332 @@ def resp_get_repository_file():
         yield rsps
 
 
+@pytest.fixture
+def resp_get_repository_raw_blob():
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            method=responses.GET,
+            url="http://localhost/api/v4/projects/1/repository/blobs/abc/raw",
+            body=b"foobar",
+            content_type="application/octet-stream",
+            status=200,
+        )
+        yield rsps
+
+
 def test_get_repository_file(project, resp_get_repository_file):
     file = project.files.get(file_path, ref=ref)
     assert isinstance(file, ProjectFile)
     assert file.file_path == file_path
+
+
+def test_repository_path_is_encoded_and_cached(gl):
+    project = gl.projects.get("group/project", lazy=True)
+    assert project._repo_path == "/projects/group%2Fproject/repository"
+    assert project._repo_path is project._repo_path
+    assert "_repo_path_cache" not in project.attributes
+
+
+def test_repository_path_follows_id_changes(gl):
+    project = gl.projects.get("group/old", lazy=True)
+    assert project._repo_path == "/projects/group%2Fold/repository"
+
+    project._update_attrs({"id": 42, "path_with_namespace": "group/old"})
+    assert project.encoded_id == 42
+    assert project._repo_path == "/projects/42/repository"
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    "kwargs,expected_params",
+    [
+        ({}, {"recursive": "False"}),
+        (
+            {"path": "docs", "ref": "main", "recursive": True},
+            {"recursive": "True", "path": "docs", "ref": "main"},
+        ),
+    ],
+)
+def test_repository_tree_query_params(project, kwargs, expected_params):
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/projects/1/repository/tree",
+        json=[{"name": "README.md"}],
+        status=200,
+        match=[responses.matchers.query_param_matcher(expected_params)],
+    )
+
+    assert project.repository_tree(**kwargs) == [{"name": "README.md"}]
+
+
+def test_repository_raw_blob(project, resp_get_repository_raw_blob):
+    assert project.repository_raw_blob("abc") == b"foobar"
+
+
+def test_repository_raw_blob_streamed(project, resp_get_repository_raw_blob):
+    chunks = []
+    result = project.repository_raw_blob(
+        "abc", streamed=True, action=chunks.append, chunk_size=3
+    )
+    assert result is None
+    assert chunks == [b"foo", b"bar"]
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    "method,kwargs",
+    [("repository_tree", {}), ("repository_blob", {"use_etag_cache": True})],
+)
+def test_etag_cache(project, method, kwargs):
+    url = "http://localhost/api/v4/projects/1/repository/tree"
+    args = ()
+    if method == "repository_blob":
+        url = "http://localhost/api/v4/projects/1/repository/blobs/abc"
+        args = ("abc",)
+    content = [{"name": "README.md"}]
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=content,
+        headers={"ETag": 'W/"abc"'},
+        status=200,
+    )
+    responses.add(
+        method=responses.GET,
+        url=url,
+        status=304,
+        match=[responses.matchers.header_matcher({"If-None-Match": 'W/"abc"'})],
+    )
+
+    assert getattr(project, method)(*args, **kwargs) == content
+    assert getattr(project, method)(*args, **kwargs) == content
+    assert responses.calls[1].response.status_code == 304
+
+
+@responses.activate
+@pytest.mark.parametrize("kwargs", [{}, {"use_etag_cache": False}])
+def test_repository_blob_etag_cache_disabled(project, kwargs):
+    url = "http://localhost/api/v4/projects/1/repository/blobs/abc"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json={"sha": "abc"},
+        headers={"ETag": 'W/"abc"'},
+        status=200,
+    )
+
+    project.repository_blob("abc", **kwargs)
+    project.repository_blob("abc", **kwargs)
+    assert all("If-None-Match" not in call.request.headers for call in responses.calls)
+
+
+@responses.activate
+def test_etag_cache_skips_large_bodies(project, monkeypatch):
+    monkeypatch.setattr(gitlab.const, "ETAG_CACHE_MAX_ENTRY_BYTES", 10)
+    url = "http://localhost/api/v4/projects/1/repository/tree"
+    responses.add(
+        method=responses.GET,
+        url=url,
+        json=[{"name": "README.md"}],
+        headers={"ETag": 'W/"abc"'},
+        status=200,
+    )
+
+    project.repository_tree()
+    project.repository_tree()
+    assert all("If-None-Match" not in call.request.headers for call in responses.calls)
+
+
+@responses.activate
+def test_archive_many(gl, tmp_path):
+    for project_id in (1, 2):
+        responses.add(
+            method=responses.GET,
+            url=f"http://localhost/api/v4/projects/{project_id}/repository/archive",
+            body=f"archive-{project_id}".encode(),
+            content_type="application/octet-stream",
+            status=200,
+        )
+    projects = [gl.projects.get(project_id, lazy=True) for project_id in (1, 2)]
+
+    paths = Project.archive_many(projects, tmp_path, max_workers=2)
+
+    assert paths == [tmp_path / "1.tar.gz", tmp_path / "2.tar.gz"]
+    assert [path.read_bytes() for path in paths] == [b"archive-1", b"archive-2"]
+
+
+@responses.activate
+def test_archive_many_removes_failed_archive(gl, tmp_path):
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/projects/1/repository/archive",
+        body=b"archive-1",
+        content_type="application/octet-stream",
+        status=200,
+    )
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/projects/2/repository/archive",
+        json={"message": "404 Not Found"},
+        status=404,
+    )
+    projects = [gl.projects.get(project_id, lazy=True) for project_id in (1, 2)]
+
+    with pytest.raises(GitlabListError):
+        Project.archive_many(projects, tmp_path, max_workers=2)
+
+    assert (tmp_path / "1.tar.gz").read_bytes() == b"archive-1"
+    assert not (tmp_path / "2.tar.gz").exists()
+
+
+@responses.activate
+@pytest.mark.parametrize(
+    "format,expected_path", [(None, "archive"), ("zip", "archive.zip")]
+)
+def test_repository_archive_format(project, format, expected_path):
+    responses.add(
+        method=responses.GET,
+        url=f"http://localhost/api/v4/projects/1/repository/{expected_path}",
+        body=b"archive",
+        content_type="application/octet-stream",
+        status=200,
+    )
+
+    assert project.repository_archive(format=format) == b"archive"
+
+
+@respx.mock
+def test_a_repository_blob(project):
+    blob = {"size": 4, "encoding": "base64", "content": "Zm9v", "sha": "abc"}
+    respx.get("http://localhost/api/v4/projects/1/repository/blobs/abc").respond(
+        json=blob
+    )
+
+    assert asyncio.run(project.a_repository_blob("abc")) == blob
+
+
+@respx.mock
+def test_async_client_per_event_loop(project):
+    gl = project.manager.gitlab
+    respx.get("http://localhost/api/v4/projects/1/repository/blobs/abc").respond(
+        json={"sha": "abc"}
+    )
+
+    async def get_blob():
+        await project.a_repository_blob("abc")
+        return (await gl._get_async_client())[0]
+
+    first = asyncio.run(get_blob())
+    assert not first.is_closed
+
+    # The client left behind by the closed loop is closed by the next one
+    second = asyncio.run(get_blob())
+    assert first.is_closed
+    assert second is not first
+    assert not second.is_closed
+
+    async def close():
+        await gl.aclose()
+
+    asyncio.run(close())
+    assert second.is_closed
+    assert not gl._async_clients
+
+
+@respx.mock
+def test_a_repository_raw_blob_streamed(project):
+    respx.get("http://localhost/api/v4/projects/1/repository/blobs/abc/raw").respond(
+        content=b"foobar", headers={"Content-Type": "application/octet-stream"}
+    )
+    chunks = []
+
+    async def fetch():
+        return await project.a_repository_raw_blob(
+            "abc", streamed=True, action=chunks.append, chunk_size=3
+        )
+
+    assert asyncio.run(fetch()) is None
+    assert chunks == [b"foo", b"bar"]
+
+
+@respx.mock
+def test_a_repository_tree_gather(gl):
+    for project_id in (1, 2):
+        respx.get(
+            f"http://localhost/api/v4/projects/{project_id}/repository/tree"
+        ).respond(json=[{"name": f"README-{project_id}.md"}])
+    projects = [gl.projects.get(project_id, lazy=True) for project_id in (1, 2)]
+
+    async def fetch():
+        return await asyncio.gather(*(p.a_repository_tree() for p in projects))
+
+    assert asyncio.run(fetch()) == [
+        [{"name": "README-1.md"}],
+        [{"name": "README-2.md"}],
+    ]
+
+
+@respx.mock
+def test_a_repository_tree_all_from_page(project):
+    url = "http://localhost/api/v4/projects/1/repository/tree"
+
+    def page(request):
+        # Like GitLab, use the last value of repeated parameters
+        number = int(request.url.params.get_list("page")[-1])
+        headers = {}
+        if number < 3 and route.call_count < 5:
+            headers["Link"] = f'<{url}?page={number + 1}&per_page=1>; rel="next"'
+        return httpx.Response(200, json=[{"name": f"{number}"}], headers=headers)
+
+    route = respx.get(url).mock(side_effect=page)
+
+    tree = asyncio.run(project.a_repository_tree(all=True, page=2, per_page=1))
+
+    assert tree == [{"name": "2"}, {"name": "3"}]
+    assert route.call_count == 2
+
+
+@respx.mock
+def test_a_repository_compare_error(project):
+    respx.get("http://localhost/api/v4/projects/1/repository/compare").respond(
+        status_code=404, json={"message": "404 Not Found"}
+    )
+
+    with pytest.raises(GitlabGetError):
+        asyncio.run(project.a_repository_compare("main", "feature"))
+
+
+@respx.mock
+def test_repository_blobs(project):
+    shas = ["a", "b", "c"]
+    for sha in shas:
+        respx.get(f"http://localhost/api/v4/projects/1/repository/blobs/{sha}").respond(
+            json={"sha": sha}
+        )
+
+    assert project.repository_blobs(shas, max_concurrency=2) == [
+        {"sha": "a"},
+        {"sha": "b"},
+        {"sha": "c"},
+    ]
+    assert not project.manager.gitlab._async_clients
+
+
+@respx.mock
+def test_repository_blobs_in_running_loop(project):
+    gl = project.manager.gitlab
+    for sha in ("a", "b"):
+        respx.get(f"http://localhost/api/v4/projects/1/repository/blobs/{sha}").respond(
+            json={"sha": sha}
+        )
+
+    async def main():
+        await project.a_repository_blob("a")
+        client, _ = await gl._get_async_client()
+        blobs = project.repository_blobs(["a", "b"])
+        # The client of this loop is left alone
+        assert not client.is_closed
+        await gl.aclose()
+        return blobs
+
+    assert asyncio.run(main()) == [{"sha": "a"}, {"sha": "b"}]
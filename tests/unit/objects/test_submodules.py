@@ -4,6 +4,9 @@ GitLab API: https://docs.gitlab.com/ce/api/repository_submodules.html
 import pytest
 import responses
 
+from gitlab import utils
+from gitlab.v4.objects.repositories import _encode
+
 
 @pytest.fixture
 def resp_update_submodule():
@@ -44,3 +47,19 @@ def test_update_submodule(project, resp_update_submodule):
     assert isinstance(ret, dict)
     assert ret["message"] == "Message"
     assert ret["id"] == "ed899a2f4b50b4370feeea94676502b42383c746"
+
+
+@pytest.mark.parametrize("submodule", ["foo/bar", utils.EncodedId("foo/bar")])
+def test_update_submodule_encodes_once(project, resp_update_submodule, submodule):
+    _encode.cache_clear()
+
+    for _ in range(2):
+        ret = project.update_submodule(
+            submodule=submodule,
+            branch="main",
+            commit_sha="4c3674f66071e30b3311dac9b9ccc90502a72664",
+        )
+        assert ret["message"] == "Message"
+
+    info = _encode.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
@@ -163,3 +163,34 @@ def test_v4_parser():
     )
     actions = user_subparsers.choices["create"]._option_string_actions
     assert actions["--name"].required
+
+
+def test_register_custom_action_does_not_wrap():
+    def action(self):
+        pass
+
+    decorated = cli.register_custom_action("FakeObject", ("foo",))(action)
+
+    assert decorated is action
+    assert "FakeObject" not in cli.custom_actions
+    cli._register_pending_actions()
+    assert cli.custom_actions["FakeObject"]["action"] == (("foo",), (), True)
+    del cli.custom_actions["FakeObject"]
+
+
+def test_register_custom_action_reuses_decorator():
+    decorator = cli.register_custom_action("FakeObject", ("foo",))
+    assert cli.register_custom_action("FakeObject", ("foo",)) is decorator
+    assert cli.register_custom_action("FakeObject", ("bar",)) is not decorator
+
+
+def test_register_custom_action_accepts_lists():
+    def action(self):
+        pass
+
+    decorator = cli.register_custom_action(["FakeObject"], ["foo"], ["bar"])
+    assert decorator(action) is action
+    assert cli.register_custom_action(("FakeObject",), ("foo",), ("bar",)) is decorator
+    cli._register_pending_actions()
+    assert cli.custom_actions["FakeObject"]["action"] == (("foo",), ("bar",), True)
+    del cli.custom_actions["FakeObject"]
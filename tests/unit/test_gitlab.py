@@ -18,9 +18,12 @@
 
 import copy
 import pickle
+import subprocess
+import sys
 import warnings
 
 import pytest
+import requests
 import responses
 
 import gitlab
@@ -104,6 +107,36 @@ def test_gitlab_build_list(gl, resp_page_1, resp_page_2):
     assert test_list[1]["c"] == "d"
 
 
+@responses.activate
+def test_gitlab_build_list_prefetch(gl, resp_page_1, resp_page_2):
+    responses.add(**resp_page_1)
+    responses.add(**resp_page_2)
+    obj = gl.http_list("/tests", as_list=False, prefetch_pages=1)
+    assert obj._pages is not None
+
+    test_list = list(obj)
+    assert test_list == [{"a": "b"}, {"c": "d"}]
+    assert obj.current_page == 2
+    assert obj.next_page == 2
+
+
+@responses.activate
+def test_gitlab_build_list_prefetch_error(gl, resp_page_1):
+    responses.add(**resp_page_1)
+    responses.add(
+        method=responses.GET,
+        url="http://localhost/api/v4/tests",
+        json={"message": "500 Internal Server Error"},
+        status=500,
+        match=[responses.matchers.query_param_matcher({"per_page": "1", "page": "2"})],
+    )
+    obj = gl.http_list("/tests", as_list=False, prefetch_pages=1)
+
+    assert next(obj) == {"a": "b"}
+    with pytest.raises(gitlab.GitlabHttpError):
+        next(obj)
+
+
 def _strip_pagination_headers(response):
     """
     https://docs.gitlab.com/ee/user/gitlab_com/index.html#pagination-response-headers
@@ -153,6 +186,44 @@ def test_gitlab_build_url(gl_trailing):
     assert r == "http://localhost/api/v4/projects"
 
 
+def test_gitlab_etag_cache_bounds(gl, monkeypatch):
+    monkeypatch.setattr(gitlab.const, "ETAG_CACHE_MAX_BYTES", 10)
+
+    def response(content):
+        result = requests.Response()
+        result.status_code = 200
+        result.headers["ETag"] = content.decode()
+        result._content = content
+        return result
+
+    gl._set_etag_cached(("a", ""), response(b"aaaa"))
+    gl._set_etag_cached(("b", ""), response(b"bbbb"))
+    gl._set_etag_cached(("a", ""), response(b"aaaa"))
+    gl._set_etag_cached(("c", ""), response(b"cccc"))
+
+    assert list(gl._etag_cache) == [("a", ""), ("c", "")]
+    assert gl._etag_cache_bytes == 8
+    assert gl._get_etag_cached(("a", "")).content == b"aaaa"
+
+
+def test_gitlab_etag_cache_response():
+    cached = requests.Response()
+    cached.status_code = 200
+    cached.headers["ETag"] = "abc"
+    cached._content = b"foobar"
+    not_modified = requests.Response()
+    not_modified.status_code = 304
+
+    result = gitlab.client._ETagCacheEntry.from_response(cached).to_response(
+        not_modified
+    )
+
+    assert result.status_code == 200
+    assert result.headers["etag"] == "abc"
+    assert result.content == b"foobar"
+    assert list(result.iter_content(3)) == [b"foo", b"bar"]
+
+
 def test_gitlab_pickability(gl):
     original_gl_objects = gl._objects
     pickled = pickle.dumps(gl)
@@ -171,11 +242,35 @@ def test_gitlab_token_auth(gl, resp_get_user):
     assert isinstance(gl.user, gitlab.v4.objects.CurrentUser)
 
 
+def test_gitlab_import_does_not_load_asyncio():
+    code = "import sys, gitlab.v4.objects; print('asyncio' in sys.modules)"
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "False"
+
+
 def test_gitlab_default_url():
     gl = gitlab.Gitlab()
     assert gl.url == gitlab.const.DEFAULT_URL
 
 
+@pytest.mark.parametrize("kwargs,expected", [({}, 32), ({"pool_size": 64}, 64)])
+def test_gitlab_pool_size(kwargs, expected):
+    gl = gitlab.Gitlab(localhost, **kwargs)
+    for prefix in ("http://", "https://"):
+        adapter = gl.session.get_adapter(f"{prefix}localhost")
+        assert adapter._pool_connections == expected
+        assert adapter._pool_maxsize == expected
+        assert adapter.max_retries.total == 0
+
+
+def test_gitlab_pool_size_custom_session():
+    session = requests.Session()
+    adapter = session.get_adapter(localhost)
+    gl = gitlab.Gitlab(localhost, session=session, pool_size=64)
+    assert gl.session is session
+    assert gl.session.get_adapter(localhost) is adapter
+
+
 @pytest.mark.parametrize(
     "args, kwargs, expected_url, expected_private_token, expected_oauth_token",
     [
@@ -15,9 +15,16 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import io
 import json
+import os
+import subprocess
+import sys
 import warnings
 
+import pytest
+import requests
+
 from gitlab import utils
 
 
@@ -95,3 +102,116 @@ class TestWarningsWrapper:
         assert warn_message in str(warning.message)
         assert __file__ in str(warning.message)
         assert warn_source == warning.source
+
+
+class TestEncodeQueryParams:
+    def test_encode_scalars(self):
+        params = {"path": "docs/api", "recursive": True, "per_page": 20}
+        assert (
+            utils.encode_query_params(params)
+            == "path=docs%2Fapi&recursive=True&per_page=20"
+        )
+
+    def test_encode_skips_none(self):
+        assert utils.encode_query_params({"sha": None, "ref": "main"}) == "ref=main"
+
+    def test_encode_lists_as_repeated_keys(self):
+        params = {"scope[]": ["created", "failed"]}
+        assert (
+            utils.encode_query_params(params)
+            == "scope%5B%5D=created&scope%5B%5D=failed"
+        )
+
+
+class FakeResponse:
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        return iter(self._chunks)
+
+    def close(self):
+        self.closed = True
+
+
+class TestResponseContentWritev:
+    def test_writes_chunks_to_file(self, tmp_path):
+        chunks = [bytes([i]) * 10 for i in range(10)]
+        path = tmp_path / "archive"
+        with open(path, "wb") as f:
+            f.write(b"header")
+            response = FakeResponse(chunks)
+            utils.response_content(response, True, f.write, 10, writev_batch_size=4)
+            assert response.closed
+            assert f.tell() == 6 + 100
+            f.write(b"footer")
+
+        assert path.read_bytes() == b"header" + b"".join(chunks) + b"footer"
+
+    def test_writes_chunks_to_pipe(self):
+        chunks = [bytes([i]) * 10 for i in range(10)]
+        read_fd, write_fd = os.pipe()
+        with open(read_fd, "rb") as reader:
+            with open(write_fd, "wb") as f:
+                assert not f.seekable()
+                response = FakeResponse(chunks)
+                utils.response_content(response, True, f.write, 10, writev_batch_size=4)
+                assert response.closed
+            assert reader.read() == b"".join(chunks)
+
+    def test_batch_size_is_capped(self, tmp_path):
+        with open(tmp_path / "archive", "wb") as f:
+            writer = utils._get_vectored_writer(f.write, 10**9)
+            assert writer is not None
+            assert writer._batch_size == utils._get_iov_max()
+            writer.close()
+
+    def test_ignores_non_file_actions(self):
+        stream = io.BytesIO()
+        response = FakeResponse([b"foo", b"bar"])
+        assert utils._get_vectored_writer(stream.write, 4) is None
+
+        utils.response_content(response, True, stream.write, 3, writev_batch_size=4)
+        assert stream.getvalue() == b"foobar"
+
+    def test_ignores_files_without_descriptor(self):
+        stream = io.BytesIO()
+        file = io.BufferedWriter(stream)
+        response = FakeResponse([b"foo", b"bar"])
+        assert utils._get_vectored_writer(file.write, 4) is None
+
+        utils.response_content(response, True, file.write, 3, writev_batch_size=4)
+        file.flush()
+        assert stream.getvalue() == b"foobar"
+
+
+class TestJsonLoads:
+    def _response(self, body):
+        response = requests.Response()
+        response._content = body
+        response.encoding = "utf-8"
+        return response
+
+    def test_json_loads(self):
+        response = self._response(b'[{"id": 1, "name": "README.md"}]')
+        assert utils.json_loads(response) == [{"id": 1, "name": "README.md"}]
+
+    def test_json_loads_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(utils, "_get_orjson", lambda: None)
+        response = self._response(b'{"id": 1}')
+        assert utils.json_loads(response) == {"id": 1}
+
+    def test_json_loads_utf16(self):
+        response = self._response('{"name": "caf\u00e9"}'.encode("utf-16"))
+        response.encoding = None
+        assert utils.json_loads(response) == {"name": "caf\u00e9"}
+
+    def test_orjson_is_imported_lazily(self):
+        code = "import sys, gitlab; print('orjson' in sys.modules)"
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        assert output.strip() == "False"
+
+    def test_json_loads_invalid(self):
+        with pytest.raises(ValueError):
+            utils.json_loads(self._response(b"not json"))